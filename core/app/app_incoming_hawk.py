@@ -34,6 +34,10 @@ async def authenticate_hawk_header(context, nonce_expire, lookup_credentials,
     if not re.match(r'^\d+$', parsed_header['ts']):
         return False, 'Invalid ts', None
 
+    # Before hashing, so replays of old requests are rejected as cheaply as possible
+    if not abs(int(datetime.now().timestamp()) - int(parsed_header['ts'])) <= 60:
+        return False, 'Stale ts', None
+
     matching_credentials = lookup_credentials(parsed_header['id'])
     if not matching_credentials:
         return False, 'Unidentified id', None
@@ -53,9 +57,6 @@ async def authenticate_hawk_header(context, nonce_expire, lookup_credentials,
     if not hmac.compare_digest(correct_payload_hash, parsed_header['hash']):
         return False, 'Invalid hash', None
 
-    if not abs(int(datetime.now().timestamp()) - int(parsed_header['ts'])) <= 60:
-        return False, 'Stale ts', None
-
     if not hmac.compare_digest(correct_mac, parsed_header['mac']):
         return False, 'Invalid mac', None
 
@@ -1,7 +1,20 @@
+# Sets the key with a short expiry, then returns it as read back
+REDIS_CHECK_SCRIPT = '''
+redis.call('SET', KEYS[1], ARGV[1], 'EX', 1)
+return redis.call('GET', KEYS[1])
+'''
+
+
 async def redis_get_metrics(context):
     return await context.redis_client.execute('GET', 'metrics')
 
 
+async def get_redis_check(context):
+    # A script so the SET and GET are a single round trip to Redis
+    return await context.redis_client.execute('EVAL', REDIS_CHECK_SCRIPT, 1, 'redis-check',
+                                              b'GREEN')
+
+
 async def set_nonce_nx(context, nonce_key, nonce_expire):
     return await context.redis_client.execute('SET', nonce_key, '1',
                                               'EX', nonce_expire, 'NX')
@@ -1,3 +1,4 @@
+import asyncio
 import hmac
 import time
 
@@ -28,6 +29,7 @@ from .utils import (
 from .app_incoming_redis import (
     redis_get_metrics,
     get_feeds_status,
+    get_redis_check,
 )
 
 NOT_PROVIDED = 'Authentication credentials were not provided.'
@@ -37,11 +39,31 @@ MISSING_CONTENT_TYPE = 'Content-Type header was not set. ' + \
 MISSING_X_FORWARDED_PROTO = 'The X-Forwarded-Proto header was not set.'
 UNKNOWN_ERROR = 'An unknown error occurred.'
 
+# aiohttp copies headers into each response, so these can be shared
+SERVER_HEADERS = {
+    'Server': 'activity-stream',
+}
+JSON_SERVER_HEADERS = {
+    'Content-Type': 'application/json; charset=utf-8',
+    'Server': 'activity-stream',
+}
+TEXT_PLAIN_HEADERS = {
+    'Content-Type': 'text/plain; charset=utf-8',
+}
+
 
 def authenticator(context, incoming_key_pairs, nonce_expire):
+    credentials_by_id = {
+        key_pair['key_id']: {
+            'id': key_pair['key_id'],
+            'key': key_pair['secret_key'],
+            'permissions': key_pair['permissions'],
+        }
+        for key_pair in incoming_key_pairs
+    }
 
     def _lookup_credentials(passed_access_key_id):
-        return lookup_credentials(incoming_key_pairs, passed_access_key_id)
+        return lookup_credentials(credentials_by_id, passed_access_key_id)
 
     @web.middleware
     async def authenticate(request, handler):
@@ -84,18 +106,12 @@ def authenticator(context, incoming_key_pairs, nonce_expire):
     return authenticate
 
 
-def lookup_credentials(incoming_key_pairs, passed_access_key_id):
-    matching_key_pairs = [
-        key_pair
-        for key_pair in incoming_key_pairs
-        if hmac.compare_digest(key_pair['key_id'], passed_access_key_id)
-    ]
+def lookup_credentials(credentials_by_id, passed_access_key_id):
+    credentials = credentials_by_id.get(passed_access_key_id)
+    is_match = credentials is not None and \
+        hmac.compare_digest(credentials['id'], passed_access_key_id)
 
-    return {
-        'id': matching_key_pairs[0]['key_id'],
-        'key': matching_key_pairs[0]['secret_key'],
-        'permissions': matching_key_pairs[0]['permissions'],
-    } if matching_key_pairs else None
+    return credentials if is_match else None
 
 
 def raven_reporter(context):
@@ -141,23 +157,22 @@ def handle_get_p1_check(parent_context):
         context = get_child_context(parent_context, 'check')
 
         with logged(context.logger.debug, context.logger.warning, 'Checking', []):
-            await context.redis_client.execute('SET', 'redis-check', b'GREEN', 'EX', 1)
-            redis_result = await context.redis_client.execute('GET', 'redis-check')
+            redis_result, min_age = await asyncio.gather(
+                get_redis_check(context),
+                es_min_verification_age(context),
+            )
             is_redis_green = redis_result == b'GREEN'
-
-            min_age = await es_min_verification_age(context)
             is_elasticsearch_green = min_age < 60 * 60 * 12
 
             all_green = is_redis_green and is_elasticsearch_green
 
-            status = \
-                (b'__UP__' if all_green else b'__DOWN__') + b'\n' + \
-                (b'redis:' + (b'GREEN' if is_redis_green else b'RED')) + b'\n' + \
-                (b'elasticsearch:' + (b'GREEN' if is_elasticsearch_green else b'RED')) + b'\n'
+            status = b''.join((
+                b'__UP__' if all_green else b'__DOWN__', b'\n',
+                b'redis:', b'GREEN' if is_redis_green else b'RED', b'\n',
+                b'elasticsearch:', b'GREEN' if is_elasticsearch_green else b'RED', b'\n',
+            ))
 
-        return web.Response(body=status, status=200, headers={
-            'Content-Type': 'text/plain; charset=utf-8',
-        })
+        return web.Response(body=status, status=200, headers=TEXT_PLAIN_HEADERS)
 
     return handle
 
@@ -169,48 +184,54 @@ def handle_get_p2_check(parent_context, feeds):
     # without making the service appear down
     grace = 30
 
+    grace_deadline = start_counter + grace
+
+    feed_ids = [feed.unique_id for feed in feeds]
+    feed_deadlines_and_lines = [
+        (
+            start_counter + feed.down_grace_period + grace,
+            feed.unique_id.encode('utf-8') + b':GREEN\n',
+            feed.unique_id.encode('utf-8') + b':RED\n',
+        )
+        for feed in feeds
+    ]
+
     async def handle(_):
         context = get_child_context(parent_context, 'check')
 
         with logged(context.logger.debug, context.logger.warning, 'Checking', []):
-            uptime = time.perf_counter() - start_counter
-            in_grace_period = uptime <= grace
+            now = time.perf_counter()
+            in_grace_period = now <= grace_deadline
 
             # The status of the feeds are via Redis...
             # - To actually reflect if each was recently sucessful, since it is done by the
             #   outgoing application, not this one
             # - To keep the guarantee that we only make a single request to each feed at any one
             #   time (locking between the outoing application and this one would be tricky)
-            feeds_statuses = await get_feeds_status(context, [
-                feed.unique_id for feed in feeds
-            ])
-            feeds_status_green_if_grace = [
-                b'RED' if uptime > feed.down_grace_period + grace and status != b'GREEN' else
-                b'GREEN'
-                for feed, status in zip(feeds, feeds_statuses)
-            ]
-            all_green = all([status == b'GREEN' for status in feeds_status_green_if_grace])
-
-            status = \
-                (b'__UP__' if all_green else b'__DOWN__') + \
-                (b' (IN_STARTUP_GRACE_PERIOD)' if in_grace_period else b'') + b'\n' + \
-                b''.join([
-                    feed.unique_id.encode('utf-8') + b':' + feeds_status_green_if_grace[i] + b'\n'
-                    for (i, feed) in enumerate(feeds)
-                ])
-
-        return web.Response(body=status, status=200, headers={
-            'Content-Type': 'text/plain; charset=utf-8',
-        })
+            feeds_statuses = await get_feeds_status(context, feed_ids)
+            all_green = True
+            feeds_status_lines = []
+            for status, (deadline, green_line, red_line) in \
+                    zip(feeds_statuses, feed_deadlines_and_lines):
+                is_green = now <= deadline or status == b'GREEN'
+                all_green = all_green and is_green
+                feeds_status_lines.append(green_line if is_green else red_line)
+
+            status = b''.join([
+                b'__UP__' if all_green else b'__DOWN__',
+                b' (IN_STARTUP_GRACE_PERIOD)' if in_grace_period else b'',
+                b'\n',
+            ] + feeds_status_lines)
+
+        return web.Response(body=status, status=200, headers=TEXT_PLAIN_HEADERS)
 
     return handle
 
 
 def handle_get_metrics(context):
     async def handle(_):
-        return web.Response(body=await redis_get_metrics(context), status=200, headers={
-            'Content-Type': 'text/plain; charset=utf-8',
-        })
+        return web.Response(body=await redis_get_metrics(context), status=200,
+                            headers=TEXT_PLAIN_HEADERS)
 
     return handle
 
@@ -231,18 +252,14 @@ def handle_get_search_v2(context, alias):
             ),
         )
 
-        return web.Response(body=results._body, status=results.status, headers={
-            'Content-Type': 'application/json; charset=utf-8',
-            'Server': 'activity-stream'
-        })
+        return web.Response(body=results._body, status=results.status,
+                            headers=JSON_SERVER_HEADERS)
 
     return handle
 
 
 def json_response(data, status):
-    return web.json_response(data, status=status, headers={
-        'Server': 'activity-stream'
-    })
+    return web.json_response(data, status=status, headers=SERVER_HEADERS)
 
 
 def server_logger(logger):
@@ -278,6 +295,9 @@ def server_logger(logger):
 
 
 def authenticate_by_ip(incorrect, ip_whitelist):
+    ip_whitelist_networks = [
+        IPv4Network(address_or_subnet) for address_or_subnet in ip_whitelist
+    ]
 
     @web.middleware
     async def _authenticate_by_ip(request, handler):
@@ -298,9 +318,10 @@ def authenticate_by_ip(incorrect, ip_whitelist):
 
         remote_address = ip_addesses[-2].strip()
 
+        remote_ip_address = IPv4Address(remote_address)
         is_allowed = any(
-            IPv4Address(remote_address) in IPv4Network(address_or_subnet)
-            for address_or_subnet in ip_whitelist
+            remote_ip_address in network
+            for network in ip_whitelist_networks
         )
         if not is_allowed:
             request['logger'].warning(
@@ -60,6 +60,7 @@ from .app_outgoing_redis import (
     set_feed_status,
 )
 from .app_outgoing_utils import (
+    prefetched,
     repeat_until_cancelled,
 )
 from .utils import (
@@ -125,8 +126,13 @@ async def run_outgoing_application():
     settings.ES_AWS_REGION = es_aws_region
     metrics_registry = CollectorRegistry()
     metrics = get_metrics(metrics_registry)
-    conn = aiohttp.TCPConnector(limit_per_host=10, use_dns_cache=False,
-                                resolver=AioHttpDnsResolver(metrics))
+    # Feeds that fetch through Feed.pages make at most one request at a time, since feed.lock is
+    # shared by their full and updates ingests. The Aventri and Maxemail feeds fetch without the
+    # lock, one request at a time in each of the two ingests, so any feed has at most 2 requests
+    # on this connector. Elasticsearch makes at most one via es_semaphore, as does Sentry via its
+    # queue, so with this many connections they never queue for a shared host
+    conn = aiohttp.TCPConnector(limit_per_host=max(10, 2 * len(feeds) + 2),
+                                use_dns_cache=False, resolver=AioHttpDnsResolver(metrics))
     single_use_conn = aiohttp.TCPConnector(limit_per_host=10, use_dns_cache=False,
                                            force_close=True, resolver=AioHttpDnsResolver(metrics))
     session = aiohttp.ClientSession(
@@ -268,16 +274,29 @@ async def ingest_full(parent_context, feed):
         await create_activities_index(context, activities_index_name)
         await create_objects_index(context, objects_index_name)
 
-        updates_href = feed.seed
-        async for page_of_activities, href in feed.pages(context, feed, feed.seed, 'full'):
-            updates_href = href
+        # The interval is between requests to the feed, so it's in the prefetching task, rather
+        # than dependent on how long each page takes to ingest
+        async def pages_at_interval():
+            feed_pages = feed.pages(context, feed, feed.seed, 'full')
+            try:
+                async for page in feed_pages:
+                    yield page
+                    await sleep(context, feed.full_ingest_page_interval)
+            finally:
+                await feed_pages.aclose()
 
-            await ingest_page(
-                context, page_of_activities, 'full', feed, [
-                    activities_index_name], [objects_index_name]
-            )
+        updates_href = feed.seed
+        pages = prefetched(pages_at_interval())
+        try:
+            async for page_of_activities, href in pages:
+                updates_href = href
 
-            await sleep(context, feed.full_ingest_page_interval)
+                await ingest_page(
+                    context, page_of_activities, 'full', feed, [
+                        activities_index_name], [objects_index_name]
+                )
+        finally:
+            await pages.aclose()
 
         await refresh_index(context, activities_index_name, feed.unique_id, 'full')
         await refresh_index(context, objects_index_name, feed.unique_id, 'full')
@@ -332,12 +351,16 @@ async def ingest_updates(parent_context, feed):
 
             activities_index_names, objects_index_names = split_index_names(indexes_to_ingest_into)
 
-            async for page_of_activities, href in feed.pages(context, feed, href, 'updates'):
-                updates_href = href
-                await ingest_page(
-                    context, page_of_activities, 'updates', feed,
-                    activities_index_names, objects_index_names,
-                )
+            pages = prefetched(feed.pages(context, feed, href, 'updates'))
+            try:
+                async for page_of_activities, href in pages:
+                    updates_href = href
+                    await ingest_page(
+                        context, page_of_activities, 'updates', feed,
+                        activities_index_names, objects_index_names,
+                    )
+            finally:
+                await pages.aclose()
 
             if updates_href is not None:
                 for index_name in indexes_matching_feeds(indexes_with_alias, [feed.unique_id]):
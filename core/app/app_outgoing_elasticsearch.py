@@ -1,13 +1,11 @@
 import asyncio
 import datetime
-import itertools
 
 from .logger import (
     logged,
 )
 from .app_outgoing_utils import (
     flatten,
-    flatten_generator,
 )
 from .utils import (
     json_dumps,
@@ -471,46 +469,42 @@ async def es_bulk_ingest(context, activities, activity_index_names, object_index
 
         with logged(context.logger.debug, context.logger.warning,
                     'Converting to Elasticsearch bulk ingest commands', []):
-            es_bulk_contents = b''.join(itertools.chain(
-                flatten_generator(
-                    [
-                        json_dumps({
-                            'index': {
-                                '_id': activity['id'],
-                                '_index': activity_index_name,
-                                '_type': '_doc',
-                            }
-                        }),
-                        b'\n',
-                        activity_json,
-                        b'\n',
-                    ]
-                    for activity in activities
-                    for activity_json in [json_dumps(activity)]
-                    for activity_index_name in activity_index_names
-                ),
-                flatten_generator(
-                    [
-                        json_dumps({
-                            'index': {
-                                '_id': activity['object']['id'],
-                                '_index': object_index_name,
-                                '_type': '_doc',
-                            }
-                        }),
-                        b'\n',
-                        object_json,
-                        b'\n',
-                    ]
-                    for activity in activities
-                    for object_json in [json_dumps(activity['object'])]
-                    for object_index_name in object_index_names
-                ),
-            ))
+            es_bulk_contents = b''.join(_es_bulk_lines(
+                activities, activity_index_names, object_index_names))
 
         await _es_bulk_post(context, es_bulk_contents)
 
 
+def _es_bulk_lines(activities, activity_index_names, object_index_names):
+    for activity in activities:
+        activity_json = json_dumps(activity)
+        for activity_index_name in activity_index_names:
+            yield json_dumps({
+                'index': {
+                    '_id': activity['id'],
+                    '_index': activity_index_name,
+                    '_type': '_doc',
+                }
+            })
+            yield b'\n'
+            yield activity_json
+            yield b'\n'
+
+    for activity in activities:
+        object_json = json_dumps(activity['object'])
+        for object_index_name in object_index_names:
+            yield json_dumps({
+                'index': {
+                    '_id': activity['object']['id'],
+                    '_index': object_index_name,
+                    '_type': '_doc',
+                }
+            })
+            yield b'\n'
+            yield object_json
+            yield b'\n'
+
+
 async def _es_bulk_post(context, es_bulk_contents):
     for i, timeout in enumerate(RETRY_TIMEOUTS):
         try:
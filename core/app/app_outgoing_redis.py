@@ -8,6 +8,7 @@ from .app_outgoing_utils import (
 )
 from .utils import (
     get_child_context,
+    random_url_safe,
     sleep,
 )
 
@@ -17,6 +18,15 @@ FEED_UPDATE_URL_EXPIRE = 60 * 60 * 24 * 31
 NOT_EXISTS = b'__NOT_EXISTS__'
 SHOW_FEED_AS_RED_IF_NO_REQUEST_IN_SECONDS = 20 * 60
 
+# Extends the lock only if it's still held by us, atomically and in a single round trip
+EXTEND_LOCK_SCRIPT = '''
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+else
+    return 0
+end
+'''
+
 
 async def acquire_and_keep_lock(parent_context, exception_intervals, key):
     ''' Prevents Elasticsearch errors during deployments
@@ -31,6 +41,10 @@ async def acquire_and_keep_lock(parent_context, exception_intervals, key):
     multiple clients to have the lock for a period of time. It would only cause
     Elasticsearch errors to appear in sentry, but otherwise there would be no
     harm
+
+    The lock holds a random token, so if it expires and is then acquired by
+    another client, this client doesn't extend it. There is no jitter in the
+    acquire interval, since there are at most two clients contending
     '''
     context = get_child_context(parent_context, 'lock')
     logger = context.logger
@@ -38,11 +52,12 @@ async def acquire_and_keep_lock(parent_context, exception_intervals, key):
     ttl = 3
     aquire_interval = 0.5
     extend_interval = 0.5
+    token = random_url_safe(32)
 
     async def acquire():
         while True:
             logger.debug('Acquiring...')
-            response = await redis_client.execute('SET', key, '1', 'EX', ttl, 'NX')
+            response = await redis_client.execute('SET', key, token, 'EX', ttl, 'NX')
             if response == b'OK':
                 logger.debug('Acquiring... (done)')
                 break
@@ -51,7 +66,7 @@ async def acquire_and_keep_lock(parent_context, exception_intervals, key):
 
     async def extend_forever():
         await sleep(context, extend_interval)
-        response = await redis_client.execute('EXPIRE', key, ttl)
+        response = await redis_client.execute('EVAL', EXTEND_LOCK_SCRIPT, 1, key, token, ttl)
         if response != 1:
             context.raven_client.captureMessage('Lock has been lost')
             await acquire()
@@ -13,6 +13,50 @@ def flatten_generator(to_flatten):
     )
 
 
+async def prefetched(aiter):
+    """Async generator over aiter that fetches the next item while the current is processed
+
+    The items are fetched in a separate task so that, for example, requesting the next page of
+    a feed overlaps with ingesting the current one. The task is ahead of the consumer at most
+    by one queued item, and by another being fetched. Exceptions raised when fetching are
+    re-raised in the consumer.
+
+    If the consumer might stop iterating early, it should aclose() the returned generator, so
+    the task and aiter are shut down then, rather than when it's garbage collected
+    """
+    queue = asyncio.Queue(maxsize=1)
+
+    async def fetch():
+        try:
+            async for item in aiter:
+                await queue.put((False, item))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            await queue.put((True, exception))
+        else:
+            await queue.put((True, None))
+        finally:
+            await aiter.aclose()
+
+    task = asyncio.get_running_loop().create_task(fetch())
+    try:
+        while True:
+            is_done, item = await queue.get()
+            if is_done:
+                if item is not None:
+                    raise item
+                break
+            yield item
+    finally:
+        task.cancel()
+        # Not awaiting the task directly, since its CancelledError would be indistinguishable
+        # from this consumer being cancelled, which must propagate
+        await asyncio.wait([task])
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+
+
 async def repeat_until_cancelled(context, exception_intervals, to_repeat,
                                  to_repeat_args=(), min_duration=0):
     loop = asyncio.get_running_loop()
@@ -1,4 +1,4 @@
-from datetime import datetime
+import functools
 import hashlib
 import hmac
 import time
@@ -84,7 +84,7 @@ async def es_request(context, method, path, query, headers, payload):
             # It's not ideal, but we have a mix of environments. Some use AWS authentication, and
             # some basic (and so with credentials in ES_URI)
             if settings.ES_AWS_ACCESS_KEY_ID:
-                host = urllib.parse.urlsplit(settings.ES_URI).hostname
+                host = _es_host(settings.ES_URI)
                 headers = dict(aws_sigv4_headers(
                     settings.ES_AWS_ACCESS_KEY_ID, settings.ES_AWS_SECRET_ACCESS_KEY,
                     settings.ES_AWS_REGION,
@@ -99,15 +99,19 @@ async def es_request(context, method, path, query, headers, payload):
             )
 
 
+@functools.lru_cache(maxsize=1)
+def _es_host(es_uri):
+    return urllib.parse.urlsplit(es_uri).hostname
+
+
 def aws_sigv4_headers(
         aws_access_key_id, aws_secret_access_key, region_name,
         pre_auth_headers, service, host, method, path, params, body):
     algorithm = 'AWS4-HMAC-SHA256'
     body_hash = hashlib.sha256(body).hexdigest()
 
-    now = datetime.utcnow()
-    amzdate = now.strftime('%Y%m%dT%H%M%SZ')
-    datestamp = now.strftime('%Y%m%d')
+    amzdate = '%04d%02d%02dT%02d%02d%02dZ' % time.gmtime()[:6]
+    datestamp = amzdate[:8]
     credential_scope = f'{datestamp}/{region_name}/{service}/aws4_request'
 
     pre_auth_headers_lower = tuple((
@@ -132,20 +136,18 @@ def aws_sigv4_headers(
             canonical_querystring = '&'.join(f'{key}={value}' for key, value in quoted_params)
             canonical_headers = ''.join(f'{key}:{value}\n' for key, value in headers)
 
-            return f'{method}\n{canonical_uri}\n{canonical_querystring}\n' + \
-                   f'{canonical_headers}\n{signed_headers}\n{body_hash}'
+            return '\n'.join((
+                method, canonical_uri, canonical_querystring, canonical_headers, signed_headers,
+                body_hash,
+            )).encode('ascii')
 
-        def sign(key, msg):
-            return hmac.new(key, msg.encode('ascii'), hashlib.sha256).digest()
+        string_to_sign = '\n'.join((
+            algorithm, amzdate, credential_scope, hashlib.sha256(canonical_request()).hexdigest(),
+        ))
 
-        string_to_sign = f'{algorithm}\n{amzdate}\n{credential_scope}\n' + \
-                         hashlib.sha256(canonical_request().encode('ascii')).hexdigest()
-
-        date_key = sign(('AWS4' + aws_secret_access_key).encode('ascii'), datestamp)
-        region_key = sign(date_key, region_name)
-        service_key = sign(region_key, service)
-        request_key = sign(service_key, 'aws4_request')
-        return sign(request_key, string_to_sign).hex()
+        request_key = _aws_sigv4_request_key(aws_secret_access_key, datestamp, region_name,
+                                             service)
+        return _aws_sigv4_sign(request_key, string_to_sign).hex()
 
     return (
         ('authorization', (
@@ -157,6 +159,19 @@ def aws_sigv4_headers(
     ) + pre_auth_headers
 
 
+# The request key only changes daily, so caching it saves 4 of the 5 HMACs per request
+@functools.lru_cache(maxsize=4)
+def _aws_sigv4_request_key(aws_secret_access_key, datestamp, region_name, service):
+    date_key = _aws_sigv4_sign(('AWS4' + aws_secret_access_key).encode('ascii'), datestamp)
+    region_key = _aws_sigv4_sign(date_key, region_name)
+    service_key = _aws_sigv4_sign(region_key, service)
+    return _aws_sigv4_sign(service_key, 'aws4_request')
+
+
+def _aws_sigv4_sign(key, msg):
+    return hmac.new(key, msg.encode('ascii'), hashlib.sha256).digest()
+
+
 def es_mappings(mappings):
     return \
         {'_doc': mappings} if settings.ES_VERSION == '6.x' else \
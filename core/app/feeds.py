@@ -53,6 +53,10 @@ class Feed(metaclass=ABCMeta):
     updates_page_interval = 1
     exception_intervals = [1, 2, 4, 8, 16, 32, 64]
 
+    # Each page is a single bulk request to Elasticsearch, which each have a fixed overhead, so
+    # larger pages mean fewer requests and more throughput
+    ingest_page_size = 1000
+
     disable_updates = False  # this is to disable updates feed, if necessary
 
     @classmethod
@@ -76,7 +80,7 @@ class Feed(metaclass=ABCMeta):
     @classmethod
     async def pages(cls, context, feed, href, ingest_type):
         """
-        async generator yielding 200 records at a time
+        async generator yielding ingest_page_size records at a time
         """
         logger = context.logger
 
@@ -128,16 +132,22 @@ class Feed(metaclass=ABCMeta):
 
                 with logged(logger.debug, logger.warning, 'Parsing JSON', []):
                     feed_parsed = json_loads(feed_contents)
+                del feed_contents
 
                 with logged(logger.debug, logger.warning, 'Convert to activities', []):
                     activities = await feed.get_activities(context, feed_parsed)
+                next_href = feed.next_href(feed_parsed)
+
+                # The raw and parsed page would otherwise stay in memory, alongside the
+                # activities, while the consumer ingests them
+                del feed_parsed
 
                 yield activities, updates_href
-                updates_href = feed.next_href(feed_parsed)
+                updates_href = next_href
 
         async def gen_evenly_sized_pages(source_pages):
             # pylint: disable=undefined-loop-variable
-            page_size = 200
+            page_size = feed.ingest_page_size
             current = []
             async for activities, updates_href in source_pages:
                 current.extend(activities)
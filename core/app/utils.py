@@ -1,13 +1,15 @@
 import asyncio
 import collections
 import itertools
-import json
 import logging
 import secrets
 import signal
 import string
 import sys
 
+import orjson
+import uvloop
+
 from .logger import (
     logged,
     get_child_logger,
@@ -39,9 +41,8 @@ async def async_enumerate(aiter):
 
 
 async def cancel_non_current_tasks():
-    current_task = asyncio.Task.current_task()
-    all_tasks = asyncio.Task.all_tasks()
-    non_current_tasks = [task for task in all_tasks if task != current_task]
+    current_task = asyncio.current_task()
+    non_current_tasks = [task for task in asyncio.all_tasks() if task is not current_task]
     for task in non_current_tasks:
         task.cancel()
     # Allow CancelledException to be thrown at the location of all awaits
@@ -193,15 +194,11 @@ def normalise_environment(key_values):
 
 
 def json_dumps(data_dict):
-    return json.dumps(
-        data_dict,
-        sort_keys=True,
-        check_circular=False,
-        ensure_ascii=False).encode('utf-8')
+    return orjson.dumps(data_dict, option=orjson.OPT_SORT_KEYS)
 
 
 def json_loads(data):
-    return json.loads(data)
+    return orjson.loads(data)
 
 
 def main(run_application_coroutine):
@@ -210,16 +207,17 @@ def main(run_application_coroutine):
     app_logger.setLevel(logging.INFO)
     app_logger.addHandler(stdout_handler)
 
-    loop = asyncio.get_event_loop()
-    cleanup = loop.run_until_complete(run_application_coroutine())
+    async def run_until_signal_then_cleanup():
+        cleanup = await run_application_coroutine()
+
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        loop.add_signal_handler(signal.SIGINT, stop.set)
+        loop.add_signal_handler(signal.SIGTERM, stop.set)
+        await stop.wait()
 
-    async def cleanup_then_stop_loop():
         await cleanup()
-        asyncio.get_event_loop().stop()
-        return 'anything-to-avoid-pylint-assignment-from-none-error'
 
-    cleanup_then_stop = cleanup_then_stop_loop()
-    loop.add_signal_handler(signal.SIGINT, loop.create_task, cleanup_then_stop)
-    loop.add_signal_handler(signal.SIGTERM, loop.create_task, cleanup_then_stop)
-    loop.run_forever()
+    uvloop.install()
+    asyncio.run(run_until_signal_then_cleanup())
     app_logger.info('Reached end of main. Exiting now.')
@@ -8,6 +8,7 @@ from aiohttp import web
 
 from .tests_utils import (
     async_test,
+    close_session,
     delete_all_es_data,
     delete_all_redis_data,
     is_http_accepted_eventually,
@@ -22,12 +23,24 @@ from .tests_utils import (
 )
 
 
+def tearDownModule():  # pylint: disable=invalid-name
+    asyncio.get_event_loop().run_until_complete(close_session())
+
+
 class TestProcess(unittest.TestCase):
 
     def add_async_cleanup(self, coroutine):
         loop = asyncio.get_event_loop()
         self.addCleanup(loop.run_until_complete, coroutine())
 
+    def add_process_cleanup(self, process):
+        async def stop():
+            if process.returncode is None:
+                process.terminate()
+            await process.wait()
+
+        self.add_async_cleanup(stop)
+
     async def terminate(self, server_out, server_inc):
         await asyncio.sleep(1)
         server_out.terminate()
@@ -38,8 +51,7 @@ class TestProcess(unittest.TestCase):
         await asyncio.sleep(1)
 
     async def setup_manual(self, common_env):
-        await delete_all_es_data()
-        await delete_all_redis_data()
+        await asyncio.gather(delete_all_es_data(), delete_all_redis_data())
 
         env = {
             **common_env,
@@ -50,19 +62,28 @@ class TestProcess(unittest.TestCase):
             'FEEDS__2__SECRET_ACCESS_KEY': '',
             'FEEDS__2__TYPE': 'activity_stream',
         }
+        # Runs last, after everything below has been stopped
+        self.add_async_cleanup(lambda: asyncio.sleep(1))
+
+        # Started one at a time so each is stopped on cleanup as soon as it's running: if a
+        # later one fails to start, the earlier ones don't leak into later tests
         feed_runner_1 = await run_feed_application(read_file, lambda: 200, lambda: {}, Mock(),
                                                    8081)
+        self.add_async_cleanup(feed_runner_1.cleanup)
         feed_runner_2 = await asyncio.create_subprocess_exec(
             *[sys.executable, '-m', 'verification_feed.app'], env={
                 **env,
                 'PORT': '8082',
             }, stdout=asyncio.subprocess.PIPE)
+        self.add_process_cleanup(feed_runner_2)
         server_out = await asyncio.create_subprocess_exec(
             *[sys.executable, '-m', 'core.app.app_outgoing'],
             env=env, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+        self.add_process_cleanup(server_out)
         server_inc = await asyncio.create_subprocess_exec(
             *[sys.executable, '-m', 'core.app.app_incoming'],
             env=env, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+        self.add_process_cleanup(server_inc)
 
         stdout_out = [None]
         stdout_inc = [None]
@@ -78,21 +99,11 @@ class TestProcess(unittest.TestCase):
         asyncio.get_event_loop().create_task(populate_stdout(server_out, stdout_out))
         asyncio.get_event_loop().create_task(populate_stdout(server_inc, stdout_inc))
 
-        async def tear_down():
+        # Runs first, stopping the readers before the processes are stopped
+        async def stop_populating_stdout():
             nonlocal is_running
             is_running = False
             await asyncio.sleep(0.2)
-            if server_out.returncode is None:
-                server_out.terminate()
-            await server_out.wait()
-            if server_inc.returncode is None:
-                server_inc.terminate()
-            await server_inc.wait()
-            if feed_runner_2.returncode is None:
-                feed_runner_2.terminate()
-            await feed_runner_2.wait()
-            await feed_runner_1.cleanup()
-            await asyncio.sleep(1)
 
         def get_server_out_stdout():
             return stdout_out[0]
@@ -100,7 +111,7 @@ class TestProcess(unittest.TestCase):
         def get_server_inc_stdout():
             return stdout_inc[0]
 
-        self.add_async_cleanup(tear_down)
+        self.add_async_cleanup(stop_populating_stdout)
         return \
             (server_out, get_server_out_stdout), \
             (server_inc, get_server_inc_stdout), \
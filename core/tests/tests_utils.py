@@ -1,18 +1,46 @@
 import asyncio
-import json
+import functools
 import os
 
 import aiohttp
 from aiohttp import web
 import aioredis
 import mohawk
+import orjson
+import uvloop
 
 from ..app.app_incoming import run_incoming_application
 from ..app.app_outgoing import run_outgoing_application
 
 
+# The applications run on uvloop, so the tests do too
+asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 ORIGINAL_SLEEP = asyncio.sleep
 
+# So a test whose data never arrives, in Elasticsearch or via the incoming application, fails
+# rather than hanging the run. Generous, since some tests wait for a full ingest on a slow CI
+# machine
+FETCH_UNTIL_TIMEOUT = 300
+
+_SESSION = None
+
+
+def get_session():
+    # Shared so connections are kept alive between requests, rather than each request paying
+    # for a new connector and connection. Unlimited so concurrent requests never queue
+    global _SESSION  # pylint: disable=global-statement
+    if _SESSION is None:
+        _SESSION = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0))
+    return _SESSION
+
+
+async def close_session():
+    global _SESSION  # pylint: disable=global-statement
+    if _SESSION is not None:
+        await _SESSION.close()
+        _SESSION = None
+
 
 async def fast_sleep(_):
     await ORIGINAL_SLEEP(0.5)
@@ -27,9 +55,10 @@ def async_test(func):
 
 
 async def run_app_until_accepts_http():
+    # The incoming application has already bound its port by the time it returns, so there is
+    # no need to poll it to find out when it accepts HTTP connections
     cleanup_inc = await run_incoming_application()
     cleanup_out = await run_outgoing_application()
-    await is_http_accepted_eventually()
 
     async def cleanup():
         await cleanup_inc()
@@ -41,9 +70,9 @@ async def is_http_accepted_eventually():
     attempts = 0
     while attempts < 20:
         try:
-            async with aiohttp.ClientSession() as session:
-                url = 'http://127.0.0.1:8080/'
-                await session.get(url, data='{}', timeout=1)
+            url = 'http://127.0.0.1:8080/'
+            async with get_session().get(url, data='{}', timeout=1):
+                pass
             return True
         except aiohttp.client_exceptions.ClientConnectorError:
             attempts += 1
@@ -54,21 +83,21 @@ async def wait_until_get_working():
     # Assume can already connect on HTTP
     attempts = 0
     while attempts < 50:
-        async with aiohttp.ClientSession() as session:
-            url = 'http://127.0.0.1:8080/v2/activities'
-            auth = hawk_auth_header(
-                'incoming-some-id-3', 'incoming-some-secret-3', url,
-                'GET', '{}', 'application/json',
-            )
-            result = await session.get(url, headers={
-                'Authorization': auth,
-                'X-Forwarded-For': '1.2.3.4, 2.2.2.2',
-                'X-Forwarded-Proto': 'http',
-                'Content-Type': 'application/json',
-            }, data='{}', timeout=1)
+        url = 'http://127.0.0.1:8080/v2/activities'
+        auth = hawk_auth_header(
+            'incoming-some-id-3', 'incoming-some-secret-3', url,
+            'GET', '{}', 'application/json',
+        )
+        headers = {
+            'Authorization': auth,
+            'X-Forwarded-For': '1.2.3.4, 2.2.2.2',
+            'X-Forwarded-Proto': 'http',
+            'Content-Type': 'application/json',
+        }
+        async with get_session().get(url, headers=headers, data='{}', timeout=1) as result:
             content = await result.content.read()
 
-        if 'hits' in json.loads(content):
+        if 'hits' in orjson.loads(content):
             return True
         attempts += 1
         # Each call makes a new ES scroll context, which is expensive
@@ -77,15 +106,18 @@ async def wait_until_get_working():
         await ORIGINAL_SLEEP(3)
 
 
+@functools.lru_cache(maxsize=None)
 def read_file(path):
     with open(os.path.dirname(os.path.abspath(__file__)) + '/' + path, 'rb') as file:
         return file.read().decode('utf-8')
 
 
 async def delete_all_es_data():
-    async with aiohttp.ClientSession() as session:
-        await session.delete('http://127.0.0.1:9200/*')
-        await session.post('http://127.0.0.1:9200/_refresh')
+    session = get_session()
+    async with session.delete('http://127.0.0.1:9200/*'):
+        pass
+    async with session.post('http://127.0.0.1:9200/_refresh'):
+        pass
 
     await fetch_until('http://127.0.0.1:9200/_search', has_exactly(0))
 
@@ -100,15 +132,13 @@ async def fetch_all_es_data_until(condition):
 
 
 async def fetch_es_index_names():
-    async with aiohttp.ClientSession() as session:
-        response = await session.get('http://127.0.0.1:9200/_alias')
-        return json.loads(await response.text()).keys()
+    async with get_session().get('http://127.0.0.1:9200/_alias') as response:
+        return orjson.loads(await response.read()).keys()
 
 
 async def fetch_es_index_names_with_alias():
-    async with aiohttp.ClientSession() as session:
-        response = await session.get('http://127.0.0.1:9200/_alias')
-        indexes = json.loads(await response.text())
+    async with get_session().get('http://127.0.0.1:9200/_alias') as response:
+        indexes = orjson.loads(await response.read())
     return [
         index_name
         for index_name, index_details in indexes.items()
@@ -118,17 +148,17 @@ async def fetch_es_index_names_with_alias():
 
 async def fetch_until(url, condition):
     async def fetch_all_es_data():
-        async with aiohttp.ClientSession() as session:
-            results = await session.get(url, json={'size': 20})
-            return json.loads(await results.text())
-
-    while True:
-        all_es_data = await fetch_all_es_data()
-        if condition(all_es_data):
-            break
-        await ORIGINAL_SLEEP(1)
+        async with get_session().get(url, json={'size': 20}) as results:
+            return orjson.loads(await results.read())
+
+    async def fetch_all_es_data_until_condition():
+        while True:
+            all_es_data = await fetch_all_es_data()
+            if condition(all_es_data):
+                return all_es_data
+            await ORIGINAL_SLEEP(1)
 
-    return all_es_data
+    return await asyncio.wait_for(fetch_all_es_data_until_condition(), FETCH_UNTIL_TIMEOUT)
 
 
 def append_until(condition):
@@ -154,13 +184,13 @@ def hawk_auth_header(key_id, secret_key, url, method, content, content_type):
 
 
 async def get(url, auth, x_forwarded_for, body):
-    async with aiohttp.ClientSession() as session:
-        result = await session.get(url, headers={
-            'Authorization': auth,
-            'Content-Type': 'application/json',
-            'X-Forwarded-For': x_forwarded_for,
-            'X-Forwarded-Proto': 'http',
-        }, data=body, timeout=3)
+    headers = {
+        'Authorization': auth,
+        'Content-Type': 'application/json',
+        'X-Forwarded-For': x_forwarded_for,
+        'X-Forwarded-Proto': 'http',
+    }
+    async with get_session().get(url, headers=headers, data=body, timeout=3) as result:
         text = await result.text()
     return (text, result.status, result.headers)
 
@@ -171,17 +201,19 @@ async def get_until(url, x_forwarded_for, condition):
 
 
 async def get_until_with_body(url, x_forwarded_for, condition, body):
-    while True:
-        auth = hawk_auth_header(
-            'incoming-some-id-3', 'incoming-some-secret-3', url, 'GET', body, 'application/json',
-        )
-        all_data, status, headers = await get(url, auth, x_forwarded_for, body)
-        dict_data = json.loads(all_data)
-        if condition(dict_data):
-            break
-        await ORIGINAL_SLEEP(1)
+    async def get_until_condition():
+        while True:
+            auth = hawk_auth_header(
+                'incoming-some-id-3', 'incoming-some-secret-3', url, 'GET', body,
+                'application/json',
+            )
+            all_data, status, headers = await get(url, auth, x_forwarded_for, body)
+            dict_data = orjson.loads(all_data)
+            if condition(dict_data):
+                return dict_data, status, headers
+            await ORIGINAL_SLEEP(1)
 
-    return dict_data, status, headers
+    return await asyncio.wait_for(get_until_condition(), FETCH_UNTIL_TIMEOUT)
 
 
 async def get_until_raw(url, x_forwarded_for, condition):
@@ -208,15 +240,15 @@ async def post(url, auth, x_forwarded_for, body):
 
 
 async def post_with_headers(url, headers, body):
-    async with aiohttp.ClientSession(skip_auto_headers=['Content-Type']) as session:
-        result = await session.post(url, headers=headers, data=body, timeout=1)
-    return (await result.text(), result.status)
+    async with get_session().post(url, headers=headers, data=body, timeout=1,
+                                  skip_auto_headers=['Content-Type']) as result:
+        return (await result.text(), result.status)
 
 
 async def get_with_headers(url, headers):
-    async with aiohttp.ClientSession(skip_auto_headers=['Content-Type']) as session:
-        result = await session.get(url, headers=headers, timeout=1, data=b'{}')
-    return (await result.text(), result.status)
+    async with get_session().get(url, headers=headers, timeout=1, data=b'{}',
+                                 skip_auto_headers=['Content-Type']) as result:
+        return (await result.text(), result.status)
 
 
 def respond_http(text, status):
@@ -231,7 +263,8 @@ def respond_shards(request):
     shard_state = \
         [{'state': 'STARTED'}] * 1 if is_schema else \
         [{'state': 'STARTED'}] * 6
-    return web.Response(text=json.dumps(shard_state), status=200, content_type='application/json')
+    return web.Response(body=orjson.dumps(shard_state), status=200,
+                        content_type='application/json')
 
 
 async def run_es_application(port, override_routes):